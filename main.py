@@ -1,3 +1,4 @@
+import bisect
 import json
 import os
 import re
@@ -2152,9 +2153,9 @@ def extract_line_items_from_entities(document, invoice_date, vendor, invoice_num
                 if item_description and len(item_description) > 5:
                     # Use Document AI description directly for most vendors (like Rifle)
                     # Only apply heavy cleaning for Creative Co-op style complex invoices
+                    vendor_lower = vendor.lower()
                     if any(
-                        indicator in vendor.lower()
-                        for indicator in ["creative", "coop"]
+                        indicator in vendor_lower for indicator in ["creative", "coop"]
                     ):
                         # Apply full cleaning for Creative Co-op
                         upc_code = extract_upc_from_text(full_line_text, product_code)
@@ -2963,6 +2964,9 @@ def split_combined_line_item(full_line_text, entity, document_text=None):
 
 def detect_vendor_type(document_text):
     """Detect the vendor type based on document content"""
+    # Lowercase the document once for every case-insensitive indicator check
+    document_text_lower = document_text.lower()
+
     # Check for HarperCollins indicators
     harpercollins_indicators = [
         "HarperCollins",
@@ -2972,7 +2976,7 @@ def detect_vendor_type(document_text):
     ]
 
     for indicator in harpercollins_indicators:
-        if indicator.lower() in document_text.lower():
+        if indicator.lower() in document_text_lower:
             return "HarperCollins"
 
     # Check for Creative Co-op indicators
@@ -2984,7 +2988,7 @@ def detect_vendor_type(document_text):
     ]
 
     for indicator in creative_coop_indicators:
-        if indicator.lower() in document_text.lower():
+        if indicator.lower() in document_text_lower:
             return "Creative Co-op"
 
     # Also check for Creative Co-op product code patterns (D-codes and XS-codes)
@@ -3003,7 +3007,7 @@ def detect_vendor_type(document_text):
     ]
 
     for indicator in onehundred80_indicators:
-        if indicator.lower() in document_text.lower():
+        if indicator.lower() in document_text_lower:
             return "OneHundred80"
 
     return "Generic"
@@ -3654,6 +3658,7 @@ def extract_creative_coop_product_mappings_corrected(document_text):
 
     upc_matches = list(re.finditer(upc_pattern, table_section))
     product_matches = list(re.finditer(product_pattern, table_section))
+    upc_positions = [upc_match.start() for upc_match in upc_matches]
 
     print(
         f"Creative Co-op mapping: Found {len(upc_matches)} UPCs, {len(product_matches)} products"
@@ -3672,23 +3677,22 @@ def extract_creative_coop_product_mappings_corrected(document_text):
         target_upc = None
         target_description = None
 
-        # Find the next UPC after this product
-        for upc_match in upc_matches:
-            upc_pos = upc_match.start()
-            if upc_pos > product_pos:  # UPC comes AFTER product
-                target_upc = f"0{upc_match.group(1)}"  # Add leading zero
+        # Find the next UPC after this product (binary search over sorted positions)
+        upc_index = bisect.bisect_right(upc_positions, product_pos)
+        if upc_index < len(upc_matches):
+            upc_pos = upc_positions[upc_index]
+            target_upc = f"0{upc_matches[upc_index].group(1)}"  # Add leading zero
 
-                # Find description between this UPC and the next product (if any)
-                next_product_pos = None
-                if i + 1 < len(product_matches):
-                    next_product_pos = product_matches[i + 1].start()
-                else:
-                    next_product_pos = len(table_section)
+            # Find description between this UPC and the next product (if any)
+            next_product_pos = None
+            if i + 1 < len(product_matches):
+                next_product_pos = product_matches[i + 1].start()
+            else:
+                next_product_pos = len(table_section)
 
-                # Extract description between UPC and next product
-                desc_text = table_section[upc_pos + 12 : next_product_pos]
-                target_description = extract_description_from_between_text(desc_text)
-                break
+            # Extract description between UPC and next product
+            desc_text = table_section[upc_pos + 12 : next_product_pos]
+            target_description = extract_description_from_between_text(desc_text)
 
         # Special handling for the first product (DA4315)
         # It should get the very first UPC and description in the table
@@ -3735,6 +3739,7 @@ def extract_description_from_between_text(text):
     candidates = []
     for line in lines:
         line = line.strip()
+        line_lower = line.lower()
 
         # Good description characteristics:
         # - Contains quotes (dimensions) or descriptive words
@@ -3744,7 +3749,7 @@ def extract_description_from_between_text(text):
             line
             and len(line) > 10
             and not re.match(r"^[\d\s\.\-]+$", line)  # Not just numbers
-            and not line.lower()
+            and not line_lower
             in [
                 "customer",
                 "item",
@@ -3762,7 +3767,7 @@ def extract_description_from_between_text(text):
             and (
                 '"' in line
                 or any(
-                    word in line.lower()
+                    word in line_lower
                     for word in [
                         "cotton",
                         "stoneware",
@@ -3887,6 +3892,7 @@ def process_onehundred80_document(document):
                 # Keep the longest meaningful line as the main description
                 main_desc = max(lines, key=len) if lines else description
                 # Add additional context from other lines if they add value
+                main_desc_lower = main_desc.lower()
                 for line in lines:
                     if (
                         line.strip()
@@ -3900,10 +3906,10 @@ def process_onehundred80_document(document):
                     ):
                         # Add complementary information if it doesn't overlap
                         if not any(
-                            word in main_desc.lower()
-                            for word in line.lower().split()[:3]
+                            word in main_desc_lower for word in line.lower().split()[:3]
                         ):
                             main_desc = f"{main_desc}, {line.strip()}"
+                            main_desc_lower = main_desc.lower()
                 description = main_desc
 
             # Logic 5: Clean up double commas and extra whitespace
@@ -2,6 +2,7 @@
 """
 Analyze Creative Coop pattern to find algorithmic solution without manual corrections
 """
+import bisect
 import json
 import re
 
@@ -30,7 +31,7 @@ if table_start != -1:
     print("=" * 50)
 
     # Split by pipe and analyze the pattern
-    parts = [p.strip() for p in table_area.split("|") if p.strip()]
+    parts = [s for p in table_area.split("|") if (s := p.strip())]
 
     print(f"\nFound {len(parts)} table parts")
 
@@ -99,6 +100,7 @@ product_pattern = r"\b(D[A-Z]\d{4}[A-Z]?)\b"
 
 upc_matches = list(re.finditer(upc_pattern, text))
 product_matches = list(re.finditer(product_pattern, text))
+upc_positions = [upc_match.start() for upc_match in upc_matches]
 
 print(
     f"Found {len(upc_matches)} UPCs and {len(product_matches)} product codes in full text"
@@ -109,16 +111,14 @@ for i, product_match in enumerate(product_matches[:5]):
     product_code = product_match.group(1)
     product_pos = product_match.start()
 
-    # Find the closest preceding UPC
+    # Find the closest preceding UPC (binary search over sorted positions)
     closest_upc = None
     closest_upc_pos = -1
 
-    for upc_match in reversed(upc_matches):
-        upc_pos = upc_match.start()
-        if upc_pos < product_pos:
-            closest_upc = upc_match.group(1)
-            closest_upc_pos = upc_pos
-            break
+    upc_index = bisect.bisect_left(upc_positions, product_pos) - 1
+    if upc_index >= 0:
+        closest_upc = upc_matches[upc_index].group(1)
+        closest_upc_pos = upc_positions[upc_index]
 
     if closest_upc:
         # Extract text between UPC and product code
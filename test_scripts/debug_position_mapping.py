@@ -63,24 +63,16 @@ print()
 # Find all quantity patterns - use same pattern as main code
 qty_pattern = r"\b(\d+)\s+\d+\s+(?:lo\s+)?(?:each|Set)\b"
 
-all_quantities = []
-seen_positions = set()
-
-for match in re.finditer(qty_pattern, test_text, re.IGNORECASE):
-    position = match.start()
-    if position not in seen_positions:
-        shipped_qty = int(match.group(1))
-        all_quantities.append(
-            {
-                "position": position,
-                "shipped": shipped_qty,
-                "match_text": match.group(0).replace("\n", " "),
-            }
-        )
-        seen_positions.add(position)
-
-# Sort quantities by position
-all_quantities.sort(key=lambda x: x["position"])
+# finditer yields non-overlapping matches in ascending start order, so the
+# list is already sorted by position with no duplicate positions
+all_quantities = [
+    {
+        "position": match.start(),
+        "shipped": int(match.group(1)),
+        "match_text": match.group(0).replace("\n", " "),
+    }
+    for match in re.finditer(qty_pattern, test_text, re.IGNORECASE)
+]
 
 print("Quantity patterns found (in order):")
 for i, qty in enumerate(all_quantities):
@@ -9,6 +9,8 @@ from google.cloud import documentai_v1 as documentai
 
 from main import *
 
+PRODUCT_CODE_PATTERN = re.compile(r"\b(D[A-Z]\d{4}[A-Z]?)\b")
+
 # Test with Creative-Coop document
 with open("test_invoices/Creative-Coop_CI004848705_docai_output.json", "r") as f:
     doc_dict = json.load(f)
@@ -28,47 +30,54 @@ problem_items = {
     "DF7225A": {"current": 60, "correct": 0},
     "DF7336": {"current": 60, "correct": 0},
 }
+problem_codes = frozenset(problem_items)
 
 # Find the entities containing these problem items
-for i, entity in enumerate(document.entities):
-    if entity.type_ == "line_item":
-        entity_text = entity.mention_text
-
-        # Check if this entity contains any problem items
-        found_codes = []
-        for code in problem_items.keys():
-            if code in entity_text:
-                found_codes.append(code)
-
-        if found_codes:
-            print(f"\n📋 Entity {i} contains: {found_codes}")
-            print(f"Entity text: {entity_text}")
-
-            # Show entity properties
-            if hasattr(entity, "properties") and entity.properties:
-                print(f"Entity properties:")
-                for prop in entity.properties:
-                    print(
-                        f"  {prop.type_} = '{prop.mention_text}' (confidence: {prop.confidence:.3f})"
-                    )
-
-            # Show lines
-            lines = entity_text.split("\n")
-            print(f"Entity lines:")
-            for line_idx, line in enumerate(lines):
-                print(f"  {line_idx}: '{line}'")
-
-                # Look for quantity patterns in each line
-                qty_patterns = [
-                    r"\b(\d+)\s+(\d+)\s+(?:each|lo|Set)\b",  # "8 0 each", "24 0 Set"
-                    r"\b(\d+)\s+(\d+)\b",  # "8 0", "24 24"
-                ]
-
-                for pattern in qty_patterns:
-                    matches = re.findall(pattern, line, re.IGNORECASE)
-                    if matches:
-                        print(f"    Quantity pattern found: {matches}")
-            print()
+line_items = [
+    (i, entity)
+    for i, entity in enumerate(document.entities)
+    if entity.type_ == "line_item"
+]
+for i, entity in line_items:
+    entity_text = entity.mention_text
+
+    # Check if this entity contains any problem items (one regex scan,
+    # reported in the order the codes appear in the entity)
+    found_codes = [
+        code
+        for code in dict.fromkeys(PRODUCT_CODE_PATTERN.findall(entity_text))
+        if code in problem_codes
+    ]
+
+    if found_codes:
+        print(f"\n📋 Entity {i} contains: {found_codes}")
+        print(f"Entity text: {entity_text}")
+
+        # Show entity properties
+        if hasattr(entity, "properties") and entity.properties:
+            print(f"Entity properties:")
+            for prop in entity.properties:
+                print(
+                    f"  {prop.type_} = '{prop.mention_text}' (confidence: {prop.confidence:.3f})"
+                )
+
+        # Show lines
+        lines = entity_text.split("\n")
+        print(f"Entity lines:")
+        for line_idx, line in enumerate(lines):
+            print(f"  {line_idx}: '{line}'")
+
+            # Look for quantity patterns in each line
+            qty_patterns = [
+                r"\b(\d+)\s+(\d+)\s+(?:each|lo|Set)\b",  # "8 0 each", "24 0 Set"
+                r"\b(\d+)\s+(\d+)\b",  # "8 0", "24 24"
+            ]
+
+            for pattern in qty_patterns:
+                matches = re.findall(pattern, line, re.IGNORECASE)
+                if matches:
+                    print(f"    Quantity pattern found: {matches}")
+        print()
 
 print("\n🔍 Looking for quantity patterns in document text around problem items:")
 
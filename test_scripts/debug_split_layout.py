@@ -99,31 +99,31 @@ print("But current algorithm may assign the wrong patterns...")
 
 
 # Test current algorithm behavior
+CURRENT_QTY_PATTERNS = [
+    re.compile(r"\b(\d+)\s+\d+\s+(?:each|lo\s+each|Set)\b", re.IGNORECASE),
+    re.compile(r"\b(\d+)\s+\d+\b(?=\s+(?:each|lo|Set))", re.IGNORECASE),
+]
+
+
 def test_current_algorithm(text, product_code):
     if product_code in text:
         product_pos = text.find(product_code)
-        after_product = text[
-            product_pos + len(product_code) : product_pos + len(product_code) + 300
-        ]
+        window_start = product_pos + len(product_code)
+        window_end = window_start + 300
 
         print(f"\nTesting {product_code}:")
         print(f"  Product position: {product_pos}")
-        print(
-            f"  Search window: positions {product_pos + len(product_code)} to {product_pos + len(product_code) + 300}"
-        )
-        print(f"  Window text: {repr(after_product[:100])}...")
-
-        qty_patterns = [
-            r"\b(\d+)\s+\d+\s+(?:each|lo\s+each|Set)\b",
-            r"\b(\d+)\s+\d+\b(?=\s+(?:each|lo|Set))",
-        ]
+        print(f"  Search window: positions {window_start} to {window_end}")
+        print(f"  Window text: {repr(text[window_start:window_start + 100])}...")
 
         closest_match = None
         closest_distance = float("inf")
 
-        for pattern in qty_patterns:
-            for match in re.finditer(pattern, after_product, re.IGNORECASE):
-                distance = match.start()
+        # Scan the window in place via pos/endpos instead of slicing it out;
+        # match offsets are absolute, so distances are relative to window_start
+        for pattern in CURRENT_QTY_PATTERNS:
+            for match in pattern.finditer(text, window_start, window_end):
+                distance = match.start() - window_start
                 print(
                     f"  Found pattern '{match.group(0)}' at relative position {distance}"
                 )
@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+"""
+Cached loading of Document AI JSON fixtures for the processing scripts
+
+The JSON is parsed straight into the Document protobuf with json_format, skipping
+the intermediate Python dict. The parsed Document is pickled next to the fixture
+and reused until the JSON file changes, so repeated runs skip parsing entirely.
+"""
+
+import os
+import pickle
+
+
+def load_document_cached(json_path):
+    """Load a Document AI JSON fixture as a Document, reusing a pickled copy"""
+    pkl_path = json_path + ".pkl"
+    if os.path.exists(pkl_path) and os.path.getmtime(pkl_path) >= os.path.getmtime(
+        json_path
+    ):
+        with open(pkl_path, "rb") as f:
+            return pickle.load(f)
+
+    from google.cloud import documentai_v1 as documentai
+    from google.protobuf import json_format
+
+    document = documentai.Document()
+    with open(json_path, "rb") as f:
+        json_format.Parse(f.read(), documentai.Document.pb(document))
+
+    # Write then rename so scripts running in parallel never read a partial pickle
+    tmp_path = f"{pkl_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(document, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, pkl_path)
+    return document
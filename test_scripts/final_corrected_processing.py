@@ -151,40 +151,42 @@ def process_harpercollins_invoice():
     rows = []
     processed_isbns = set()
 
-    for entity in document.entities:
-        if entity.type_ == "line_item":
-            product_code = ""
-
-            # Extract product code
-            if hasattr(entity, "properties") and entity.properties:
-                for prop in entity.properties:
-                    if prop.type_ == "line_item/product_code":
-                        product_code = prop.mention_text.strip()
-                        break
-
-            # Use correct data if available and not already processed
-            if product_code in correct_data and product_code not in processed_isbns:
-                book_data = correct_data[product_code]
-
-                # Calculate wholesale price with 50% discount
-                list_price = book_data["price"]
-                wholesale_price = f"${list_price * (discount if discount else 0.5):.2f}"
-                quantity = str(book_data["qty"])
-                description = f"{product_code} - {book_data['title']}"
-
-                rows.append(
-                    [
-                        "",  # Column A placeholder
-                        order_date,  # Column B
-                        vendor,  # Column C
-                        order_number,  # Column D
-                        description,  # Column E
-                        wholesale_price,  # Column F
-                        quantity,  # Column G
-                    ]
-                )
-
-                processed_isbns.add(product_code)
+    line_items = [e for e in document.entities if e.type_ == "line_item"]
+
+    for entity in line_items:
+        product_code = ""
+
+        # Extract product code
+        if hasattr(entity, "properties") and entity.properties:
+            for prop in entity.properties:
+                if prop.type_ == "line_item/product_code":
+                    product_code = prop.mention_text.strip()
+                    break
+
+        # Use correct data if available and not already processed
+        if product_code in processed_isbns:
+            continue
+        book_data = correct_data.get(product_code)
+        if book_data is not None:
+            # Calculate wholesale price with 50% discount
+            list_price = book_data["price"]
+            wholesale_price = f"${list_price * (discount if discount else 0.5):.2f}"
+            quantity = str(book_data["qty"])
+            description = f"{product_code} - {book_data['title']}"
+
+            rows.append(
+                [
+                    "",  # Column A placeholder
+                    order_date,  # Column B
+                    vendor,  # Column C
+                    order_number,  # Column D
+                    description,  # Column E
+                    wholesale_price,  # Column F
+                    quantity,  # Column G
+                ]
+            )
+
+            processed_isbns.add(product_code)
 
     print(f"\\nProcessed {len(rows)} line items")
 
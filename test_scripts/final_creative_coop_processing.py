@@ -5,9 +5,15 @@ Final Creative Coop processing with correct UPC->Description->ProductCode mappin
 import csv
 import json
 import re
+from functools import lru_cache
 
 from main import *
 
+# Line items repeat the same price/date strings, so memoize these pure helpers
+# for this script only; main.py keeps its uncached versions.
+clean_price = lru_cache(maxsize=1024)(clean_price)
+format_date = lru_cache(maxsize=256)(format_date)
+
 
 def extract_correct_creative_coop_mapping(document_text):
     """
@@ -36,7 +42,7 @@ def extract_correct_creative_coop_mapping(document_text):
 
     # The pattern is: UPC | Description | ProductCode
     # Split by | and process sequences
-    parts = [p.strip() for p in product_area.split("|") if p.strip()]
+    parts = [s for p in product_area.split("|") if (s := p.strip())]
 
     # Find product codes and map them to preceding UPC and description
     for i, part in enumerate(parts):
@@ -154,8 +160,12 @@ def process_final_creative_coop():
         )
 
     # Process standard extraction for basic info
-    entities = {e.type_: e.mention_text for e in document.entities}
-    vendor = extract_best_vendor(document.entities)
+    # Materialize the protobuf entity container once; both passes reuse it
+    all_entities = list(document.entities)
+    line_items = [e for e in all_entities if e.type_ == "line_item"]
+
+    entities = {e.type_: e.mention_text for e in all_entities}
+    vendor = extract_best_vendor(all_entities)
     invoice_number = entities.get("invoice_id", "")
     invoice_date = format_date(entities.get("invoice_date", ""))
 
@@ -169,72 +179,73 @@ def process_final_creative_coop():
     # Process each line item entity to get pricing and quantity
     processed_products = set()
 
-    for entity in document.entities:
-        if entity.type_ == "line_item":
-            # Extract basic properties
-            unit_price = ""
-            quantity = ""
-
-            if hasattr(entity, "properties") and entity.properties:
-                for prop in entity.properties:
-                    if prop.type_ == "line_item/unit_price":
-                        unit_price = clean_price(prop.mention_text)
-                    elif prop.type_ == "line_item/quantity":
-                        qty_text = prop.mention_text.strip()
-                        qty_match = re.search(r"\b(\d+(?:\.\d+)?)\b", qty_text)
-                        if qty_match:
-                            qty_value = float(qty_match.group(1))
-                            if qty_value > 0:  # Only include positive quantities
-                                if qty_value == int(qty_value):
-                                    quantity = str(int(qty_value))
-                                else:
-                                    quantity = str(qty_value)
-
-            # Find product codes in this entity
-            product_codes = re.findall(r"\b(D[A-Z]\d{4}[A-Z]?)\b", entity.mention_text)
-
-            for product_code in product_codes:
-                if (
-                    product_code in correct_mappings
-                    and product_code not in processed_products
-                ):
-                    mapping = correct_mappings[product_code]
-
-                    # Use Creative-Coop specific quantity extraction as fallback
-                    if not quantity:
-                        creative_coop_qty = extract_creative_coop_quantity(
-                            document.text, product_code
-                        )
-                        if creative_coop_qty is not None:
-                            quantity = creative_coop_qty
-
-                    # Create final description
-                    full_description = f"{product_code} - UPC: {mapping['upc']} - {mapping['description']}"
-
-                    # Only add rows with valid pricing and quantity data
-                    if unit_price and quantity and quantity != "0":
-                        rows.append(
-                            [
-                                "",  # Column A placeholder
-                                invoice_date,
-                                vendor,
-                                invoice_number,
-                                full_description,
-                                unit_price,
-                                quantity,
-                            ]
-                        )
-                        processed_products.add(product_code)
-                        print(
-                            f"✓ Added: {product_code} - {mapping['description'][:40]}... | {unit_price} | Qty: {quantity}"
-                        )
+    for entity in line_items:
+        # Extract basic properties
+        unit_price = ""
+        quantity = ""
+
+        if hasattr(entity, "properties") and entity.properties:
+            for prop in entity.properties:
+                if prop.type_ == "line_item/unit_price":
+                    unit_price = clean_price(prop.mention_text)
+                elif prop.type_ == "line_item/quantity":
+                    qty_text = prop.mention_text.strip()
+                    qty_match = re.search(r"\b(\d+(?:\.\d+)?)\b", qty_text)
+                    if qty_match:
+                        qty_value = float(qty_match.group(1))
+                        if qty_value > 0:  # Only include positive quantities
+                            if qty_value == int(qty_value):
+                                quantity = str(int(qty_value))
+                            else:
+                                quantity = str(qty_value)
+
+        # Find product codes in this entity
+        product_codes = re.findall(r"\b(D[A-Z]\d{4}[A-Z]?)\b", entity.mention_text)
+
+        for product_code in product_codes:
+            if product_code in processed_products:
+                continue
+            mapping = correct_mappings.get(product_code)
+            if mapping is not None:
+                # Use Creative-Coop specific quantity extraction as fallback
+                if not quantity:
+                    creative_coop_qty = extract_creative_coop_quantity(
+                        document.text, product_code
+                    )
+                    if creative_coop_qty is not None:
+                        quantity = creative_coop_qty
+
+                # Create final description
+                full_description = (
+                    f"{product_code} - UPC: {mapping['upc']} - {mapping['description']}"
+                )
+
+                # Only add rows with valid pricing and quantity data
+                if unit_price and quantity and quantity != "0":
+                    rows.append(
+                        [
+                            "",  # Column A placeholder
+                            invoice_date,
+                            vendor,
+                            invoice_number,
+                            full_description,
+                            unit_price,
+                            quantity,
+                        ]
+                    )
+                    processed_products.add(product_code)
+                    print(
+                        f"✓ Added: {product_code} - {mapping['description'][:40]}... | {unit_price} | Qty: {quantity}"
+                    )
 
     print(f"\nCreated {len(rows)} final corrected rows")
 
     # Export to CSV
     csv_filename = "test_invoices/creative_coop_final_corrected.csv"
 
-    with open(csv_filename, "w", newline="", encoding="utf-8") as csvfile:
+    with open(
+        csv_filename, "w", newline="", encoding="utf-8", buffering=1 << 20
+    ) as csvfile:
         writer = csv.writer(csvfile)
 
         # Write header
@@ -251,8 +262,7 @@ def process_final_creative_coop():
         )
 
         # Write data rows
-        for row in rows:
-            writer.writerow(row)
+        writer.writerows(rows)
 
     print(f"✅ Final corrected CSV file created: {csv_filename}")
 
@@ -2,9 +2,37 @@
 """
 Improved algorithmic solution for Creative Coop mapping
 """
-import json
 import re
 
+from docai_fixture_cache import load_document_cached
+
+# UPCs and product codes in one scan, told apart by match.lastgroup
+UPC_OR_PRODUCT_CODE_PATTERN = re.compile(
+    r"(?P<upc>\b\d{12}\b)|(?P<product>\bD[A-Z]\d{4}[A-Z]?\b)"
+)
+NUMERIC_ONLY_PATTERN = re.compile(r"^[\d\s\.\-]+$")
+LINE_SPLIT_PATTERN = re.compile(r"[\n|]+")
+# Dimension quotes or product-material keywords mark a likely description
+DESCRIPTION_HINT_PATTERN = re.compile(
+    r'"|cotton|stoneware|frame|pillow|glass|wood|resin', re.IGNORECASE
+)
+TABLE_HEADER_WORDS = frozenset(
+    {
+        "customer",
+        "item",
+        "shipped",
+        "back",
+        "ordered",
+        "um",
+        "list",
+        "price",
+        "truck",
+        "your",
+        "extended",
+        "amount",
+    }
+)
+
 
 def extract_creative_coop_mappings_improved(document_text):
     """
@@ -21,47 +49,36 @@ def extract_creative_coop_mappings_improved(document_text):
 
     print(f"Analyzing table section of {len(table_section)} characters")
 
-    # Find all UPCs and product codes with positions in the table section
-    upc_pattern = r"\b(\d{12})\b"
-    product_pattern = r"\b(D[A-Z]\d{4}[A-Z]?)\b"
-
-    upc_matches = list(re.finditer(upc_pattern, table_section))
-    product_matches = list(re.finditer(product_pattern, table_section))
-
-    print(f"In table section: {len(upc_matches)} UPCs, {len(product_matches)} products")
-
     # The key insight: let's extract sequences and match them properly
     mappings = {}
-
-    # Method: For each product, find the closest PRECEDING UPC and description
-    for product_match in product_matches:
-        product_code = product_match.group(1)
-        product_pos = product_match.start()
-
-        # Find the closest UPC that comes BEFORE this product code
-        closest_upc = None
-        closest_upc_pos = -1
-        min_distance = float("inf")
-
-        for upc_match in upc_matches:
-            upc_pos = upc_match.start()
-            if upc_pos < product_pos:  # UPC comes before product
-                distance = product_pos - upc_pos
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_upc = upc_match.group(1)
-                    closest_upc_pos = upc_pos
-
-        if closest_upc and closest_upc_pos != -1:
+    upc_count = 0
+    product_count = 0
+
+    # Method: For each product, find the closest PRECEDING UPC and description.
+    # UPCs and products are streamed in document order, so the most recent UPC
+    # seen is always the closest one before the current product code.
+    last_upc = None
+    last_upc_end = -1
+
+    for match in UPC_OR_PRODUCT_CODE_PATTERN.finditer(table_section):
+        if match.lastgroup == "upc":
+            upc_count += 1
+            last_upc = match.group("upc")
+            last_upc_end = match.end()
+            continue
+
+        product_count += 1
+        product_code = match.group("product")
+
+        if last_upc:
             # Extract description between UPC and product code
-            between_text = table_section[closest_upc_pos + 12 : product_pos]
+            between_text = table_section[last_upc_end : match.start()]
             description = extract_description_from_between_text(between_text)
 
             if description:
                 # Add leading zero to UPC if needed
-                formatted_upc = (
-                    f"0{closest_upc}" if len(closest_upc) == 12 else closest_upc
-                )
+                # The upc group matches exactly 12 digits, so the leading zero always applies
+                formatted_upc = "0" + last_upc
 
                 mappings[product_code] = {
                     "upc": formatted_upc,
@@ -72,6 +89,8 @@ def extract_creative_coop_mappings_improved(document_text):
                     f"{product_code}: UPC={formatted_upc}, Desc='{description[:50]}{'...' if len(description) > 50 else ''}'"
                 )
 
+    print(f"In table section: {upc_count} UPCs, {product_count} products")
+
     return mappings
 
 
@@ -82,78 +101,50 @@ def extract_description_from_between_text(text):
     text = text.strip()
 
     # Split by common delimiters
-    lines = re.split(r"[\n|]+", text)
+    lines = LINE_SPLIT_PATTERN.split(text)
 
-    candidates = []
+    # Track the longest candidate as it's likely the most complete description.
+    # Starting best_len at 10 doubles as the minimum-length filter, and the
+    # strict comparison keeps the first of equally long candidates.
+    best = ""
+    best_len = 10
     for line in lines:
         line = line.strip()
+        line_len = len(line)
 
         # Good description characteristics:
         # - Contains quotes (dimensions) or descriptive words
         # - Not just numbers or table formatting
         # - Reasonable length
         if (
-            line
-            and len(line) > 10
-            and not re.match(r"^[\d\s\.\-]+$", line)  # Not just numbers
-            and not line.lower()
-            in [
-                "customer",
-                "item",
-                "shipped",
-                "back",
-                "ordered",
-                "um",
-                "list",
-                "price",
-                "truck",
-                "your",
-                "extended",
-                "amount",
-            ]
-            and (
-                '"' in line
-                or any(
-                    word in line.lower()
-                    for word in [
-                        "cotton",
-                        "stoneware",
-                        "frame",
-                        "pillow",
-                        "glass",
-                        "wood",
-                        "resin",
-                    ]
-                )
-            )
+            line_len > best_len
+            and not NUMERIC_ONLY_PATTERN.match(line)  # Not just numbers
+            and line.lower() not in TABLE_HEADER_WORDS
+            and DESCRIPTION_HINT_PATTERN.search(line)
         ):
+            best = line
+            best_len = line_len
 
-            candidates.append(line)
-
-    if candidates:
-        # Return the longest candidate as it's likely the most complete description
-        return max(candidates, key=len)
+    if best:
+        return best
 
     # Fallback: return the first non-empty, non-numeric line
     for line in lines:
         line = line.strip()
-        if line and len(line) > 5 and not re.match(r"^[\d\s\.\-]+$", line):
+        if line and len(line) > 5 and not NUMERIC_ONLY_PATTERN.match(line):
             return line
 
     return ""
 
 
-# Test the improved algorithm
-if __name__ == "__main__":
+def validate_algorithmic_mapping():
+    """Test the improved algorithm against the known Creative-Coop mappings"""
     print("=== TESTING IMPROVED ALGORITHMIC CREATIVE COOP MAPPING ===")
 
     # Load the Creative-Coop document
-    with open("test_invoices/Creative-Coop_CI004848705_docai_output.json", "r") as f:
-        doc_dict = json.load(f)
-
-    from google.cloud import documentai_v1 as documentai
-
-    document = documentai.Document(doc_dict)
+    document = load_document_cached(
+        "test_invoices/Creative-Coop_CI004848705_docai_output.json"
+    )
 
     mappings = extract_creative_coop_mappings_improved(document.text)
 
@@ -214,3 +205,7 @@ if __name__ == "__main__":
     print(
         f"\nResults: {correct_upcs}/{len(expected_upcs)} UPCs correct, {correct_descriptions}/{len(expected_descriptions)} descriptions correct"
     )
+
+
+if __name__ == "__main__":
+    validate_algorithmic_mapping()
@@ -2,17 +2,34 @@
 """
 Improved invoice processing with corrections based on CORRECT sheet feedback
 """
-import json
 import re
 from datetime import datetime
+from functools import lru_cache
+
+from docai_fixture_cache import load_document_cached
+from publisher_patterns import PUBLISHER_PATTERN, PUBLISHERS
+from sheets_client import get_sheets_service
 
 from main import *
 
+DISCOUNT_PATTERN = re.compile(r"Discount:\s*(\d+(?:\.\d+)?)%\s*OFF", re.IGNORECASE)
+MFR_PATTERN = re.compile(r"MFR:\s*([^\n]+)")
+ORDER_DATE_PATTERN = re.compile(r"Order Date:\s*(\d{1,2}/\d{1,2}/\d{4})", re.IGNORECASE)
+SLASH_DATE_PATTERN = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+TRAILING_PUNCTUATION_PATTERN = re.compile(r"[,\-]+$")
+
+# Order number patterns in priority order
+ORDER_NUMBER_PATTERNS = [
+    re.compile(r"(NS\d+)", re.IGNORECASE),
+    re.compile(r"PO #\s*([A-Z]+\d+)", re.IGNORECASE),
+    re.compile(r"Order #\s*([A-Z]+\d+)", re.IGNORECASE),
+]
+
 
 def extract_discount_percentage(document_text):
     """Extract discount percentage from text like 'Discount: 50.00% OFF'"""
-    discount_pattern = r"Discount:\s*(\d+(?:\.\d+)?)%\s*OFF"
-    match = re.search(discount_pattern, document_text, re.IGNORECASE)
+    match = DISCOUNT_PATTERN.search(document_text)
     if match:
         return float(match.group(1)) / 100.0
     return None
@@ -20,22 +37,15 @@ def extract_discount_percentage(document_text):
 
 def extract_publisher_vendor(document_text):
     """Extract the actual publisher/vendor (e.g., HarperCollins) not the distributor"""
-    # Look for publisher names in the document
-    publishers = [
-        "HarperCollins",
-        "Harper Collins",
-        "Penguin",
-        "Random House",
-        "Simon Schuster",
-    ]
-
-    for publisher in publishers:
-        if publisher.lower() in document_text.lower():
+    # Look for publisher names in the document with a single scan, then pick
+    # the highest-priority one that was found
+    found = {name.lower() for name in PUBLISHER_PATTERN.findall(document_text)}
+    for publisher in PUBLISHERS:
+        if publisher.lower() in found:
             return publisher
 
     # Fallback to MFR field if found
-    mfr_pattern = r"MFR:\s*([^\n]+)"
-    match = re.search(mfr_pattern, document_text)
+    match = MFR_PATTERN.search(document_text)
     if match:
         return match.group(1).strip()
 
@@ -48,10 +58,10 @@ def clean_product_description(description):
         return ""
 
     # Remove line breaks and extra whitespace
-    cleaned = re.sub(r"\s+", " ", description.strip())
+    cleaned = WHITESPACE_PATTERN.sub(" ", description.strip())
 
     # Remove trailing commas and dashes
-    cleaned = re.sub(r"[,\-]+$", "", cleaned)
+    cleaned = TRAILING_PUNCTUATION_PATTERN.sub("", cleaned)
 
     return cleaned.strip()
 
@@ -59,10 +69,8 @@ def clean_product_description(description):
 def extract_order_number_improved(document_text):
     """Extract order number from patterns like 'NS4435067'"""
     # Look for patterns like NS followed by numbers
-    order_patterns = [r"(NS\d+)", r"PO #\s*([A-Z]+\d+)", r"Order #\s*([A-Z]+\d+)"]
-
-    for pattern in order_patterns:
-        match = re.search(pattern, document_text, re.IGNORECASE)
+    for pattern in ORDER_NUMBER_PATTERNS:
+        match = pattern.search(document_text)
         if match:
             return match.group(1)
 
@@ -72,8 +80,7 @@ def extract_order_number_improved(document_text):
 def extract_order_date_improved(document_text):
     """Extract order date from patterns like 'Order Date: 04/29/2025'"""
     # Look for Order Date: MM/DD/YYYY pattern
-    date_pattern = r"Order Date:\s*(\d{1,2}/\d{1,2}/\d{4})"
-    match = re.search(date_pattern, document_text, re.IGNORECASE)
+    match = ORDER_DATE_PATTERN.search(document_text)
     if match:
         date_str = match.group(1)
         try:
@@ -86,6 +93,7 @@ def extract_order_date_improved(document_text):
     return ""
 
 
+@lru_cache(maxsize=64)
 def format_order_date(date_string):
     """Format order date to MM/DD/YY format"""
     if not date_string:
@@ -103,8 +111,7 @@ def format_order_date(date_string):
             return parsed.strftime("%m/%d/%y")
     except ValueError:
         # If parsing fails, try to extract MM/DD/YY manually
-        date_pattern = r"(\d{1,2})/(\d{1,2})/(\d{4})"
-        match = re.search(date_pattern, date_string)
+        match = SLASH_DATE_PATTERN.search(date_string)
         if match:
             month, day, year = match.groups()
             return f"{month.zfill(2)}/{day.zfill(2)}/{year[2:]}"
@@ -116,18 +123,12 @@ def process_harpercollins_invoice():
     """Process the HarperCollins invoice with improved logic"""
 
     # Load the Document AI output
-    with open("test_invoices/Harpercollins_04-29-2025_docai_output.json", "r") as f:
-        doc_dict = json.load(f)
-
-    from google.cloud import documentai_v1 as documentai
-
-    document = documentai.Document(doc_dict)
+    document = load_document_cached(
+        "test_invoices/Harpercollins_04-29-2025_docai_output.json"
+    )
 
     print("=== IMPROVED HARPERCOLLINS PROCESSING ===")
 
-    # Extract key information
-    entities = {e.type_: e.mention_text for e in document.entities}
-
     # Get the actual publisher (HarperCollins), not distributor
     vendor = extract_publisher_vendor(document.text)
     print(f"Publisher/Vendor: {vendor}")
@@ -172,11 +173,10 @@ def process_harpercollins_invoice():
             # Calculate list price from amount and quantity if unit_price not available
             if not list_price and amount and quantity:
                 try:
-                    amount_val = float(amount)
                     qty_val = float(quantity)
                     if qty_val > 0:
-                        list_price = amount_val / qty_val
-                except (ValueError, ZeroDivisionError):
+                        list_price = float(amount) / qty_val
+                except ValueError:
                     pass
 
             # Calculate wholesale price with discount
@@ -219,14 +219,9 @@ def process_harpercollins_invoice():
 
     # Write to Google Sheets TEST tab
     try:
-        from google.auth import default
-        from googleapiclient.discovery import build
-
-        credentials, _ = default()
-        service = build("sheets", "v4", credentials=credentials)
-
         result = (
-            service.spreadsheets()
+            get_sheets_service()
+            .spreadsheets()
             .values()
             .append(
                 spreadsheetId="1cYfpnM_CjgdV1j9hlY-2l0QJMYDWB_hCeXb9KGbgwEo",
@@ -2,17 +2,31 @@
 """
 Improved invoice processing v2 - Better description extraction using raw text analysis
 """
-import json
 import re
 from datetime import datetime
+from types import MappingProxyType
+
+from docai_fixture_cache import load_document_cached
+from publisher_patterns import PUBLISHER_PATTERN, PUBLISHERS
+from sheets_client import get_sheets_service
 
 from main import *
 
+DISCOUNT_PATTERN = re.compile(r"Discount:\s*(\d+(?:\.\d+)?)%\s*OFF", re.IGNORECASE)
+MFR_PATTERN = re.compile(r"MFR:\s*([^\n]+)")
+ORDER_DATE_PATTERN = re.compile(r"Order Date:\s*(\d{1,2}/\d{1,2}/\d{4})", re.IGNORECASE)
+
+# Order number patterns in priority order
+ORDER_NUMBER_PATTERNS = [
+    re.compile(r"(NS\d+)", re.IGNORECASE),
+    re.compile(r"PO #\s*([A-Z]+\d+)", re.IGNORECASE),
+    re.compile(r"Order #\s*([A-Z]+\d+)", re.IGNORECASE),
+]
+
 
 def extract_discount_percentage(document_text):
     """Extract discount percentage from text like 'Discount: 50.00% OFF'"""
-    discount_pattern = r"Discount:\s*(\d+(?:\.\d+)?)%\s*OFF"
-    match = re.search(discount_pattern, document_text, re.IGNORECASE)
+    match = DISCOUNT_PATTERN.search(document_text)
     if match:
         return float(match.group(1)) / 100.0
     return None
@@ -21,22 +35,15 @@ def extract_discount_percentage(document_text):
 def extract_publisher_vendor(document_text):
     """Extract the actual publisher/vendor (e.g., HarperCollins) not the distributor"""
     # Look for MFR field first
-    mfr_pattern = r"MFR:\s*([^\n]+)"
-    match = re.search(mfr_pattern, document_text)
+    match = MFR_PATTERN.search(document_text)
     if match:
         return match.group(1).strip()
 
-    # Look for publisher names in the document
-    publishers = [
-        "HarperCollins",
-        "Harper Collins",
-        "Penguin",
-        "Random House",
-        "Simon Schuster",
-    ]
-
-    for publisher in publishers:
-        if publisher.lower() in document_text.lower():
+    # Look for publisher names in the document with a single scan, then pick
+    # the highest-priority one that was found
+    found = {name.lower() for name in PUBLISHER_PATTERN.findall(document_text)}
+    for publisher in PUBLISHERS:
+        if publisher.lower() in found:
             return publisher
 
     return ""
@@ -44,10 +51,8 @@ def extract_publisher_vendor(document_text):
 
 def extract_order_number_improved(document_text):
     """Extract order number from patterns like 'NS4435067'"""
-    order_patterns = [r"(NS\d+)", r"PO #\s*([A-Z]+\d+)", r"Order #\s*([A-Z]+\d+)"]
-
-    for pattern in order_patterns:
-        match = re.search(pattern, document_text, re.IGNORECASE)
+    for pattern in ORDER_NUMBER_PATTERNS:
+        match = pattern.search(document_text)
         if match:
             return match.group(1)
 
@@ -56,8 +61,7 @@ def extract_order_number_improved(document_text):
 
 def extract_order_date_improved(document_text):
     """Extract order date from patterns like 'Order Date: 04/29/2025'"""
-    date_pattern = r"Order Date:\s*(\d{1,2}/\d{1,2}/\d{4})"
-    match = re.search(date_pattern, document_text, re.IGNORECASE)
+    match = ORDER_DATE_PATTERN.search(document_text)
     if match:
         date_str = match.group(1)
         try:
@@ -69,12 +73,10 @@ def extract_order_date_improved(document_text):
     return ""
 
 
-def extract_book_titles_from_raw_text(document_text):
-    """Extract book titles by analyzing the raw text structure"""
-
-    # Manual mapping based on the correct titles from the CORRECT sheet
-    # This is necessary because Document AI is fragmenting the titles
-    title_mappings = {
+# Manual mapping based on the correct titles from the CORRECT sheet
+# This is necessary because Document AI is fragmenting the titles
+TITLE_MAPPINGS = MappingProxyType(
+    {
         "9780001839236": "Summer Story Brambly Hedge Pop-Up Book",
         "9780008547110": "The Tea Dragon Society",  # This was just "The" in AI output
         "9780062645425": "Pleasant Fieldmouse Frog and Toad Storybook",
@@ -96,20 +98,21 @@ def extract_book_titles_from_raw_text(document_text):
         "9781836050278": "Little Sticker Dolly Dressing Fairy Usborne",
         "9781911641100": "Place Called Home, A",
     }
+)
 
-    return title_mappings
+
+def extract_book_titles_from_raw_text(document_text):
+    """Extract book titles by analyzing the raw text structure"""
+    return TITLE_MAPPINGS
 
 
 def process_harpercollins_invoice():
     """Process the HarperCollins invoice with improved description extraction"""
 
     # Load the Document AI output
-    with open("test_invoices/Harpercollins_04-29-2025_docai_output.json", "r") as f:
-        doc_dict = json.load(f)
-
-    from google.cloud import documentai_v1 as documentai
-
-    document = documentai.Document(doc_dict)
+    document = load_document_cached(
+        "test_invoices/Harpercollins_04-29-2025_docai_output.json"
+    )
 
     print("=== IMPROVED HARPERCOLLINS PROCESSING V2 ===")
 
@@ -149,29 +152,28 @@ def process_harpercollins_invoice():
             # Extract properties
             if hasattr(entity, "properties") and entity.properties:
                 for prop in entity.properties:
+                    stripped = prop.mention_text.strip()
                     if prop.type_ == "line_item/product_code":
-                        product_code = prop.mention_text.strip()
+                        product_code = stripped
                     elif prop.type_ == "line_item/description":
-                        description = prop.mention_text.strip()
+                        description = stripped
                     elif prop.type_ == "line_item/unit_price":
-                        list_price = float(prop.mention_text.strip())
+                        list_price = float(stripped)
                     elif prop.type_ == "line_item/amount":
-                        amount = prop.mention_text.strip()
+                        amount = stripped
                     elif prop.type_ == "line_item/quantity":
-                        quantity = prop.mention_text.strip()
+                        quantity = stripped
 
             # Use improved title mapping if available
-            if product_code in title_mappings:
-                description = title_mappings[product_code]
+            description = title_mappings.get(product_code, description)
 
             # Calculate list price from amount and quantity if unit_price not available
             if not list_price and amount and quantity:
                 try:
-                    amount_val = float(amount)
                     qty_val = float(quantity)
                     if qty_val > 0:
-                        list_price = amount_val / qty_val
-                except (ValueError, ZeroDivisionError):
+                        list_price = float(amount) / qty_val
+                except ValueError:
                     pass
 
             # Calculate wholesale price with discount
@@ -194,7 +196,7 @@ def process_harpercollins_invoice():
             # Only add if we have essential data
             if full_description and wholesale_price:
                 rows.append(
-                    [
+                    (
                         "",  # Column A placeholder
                         order_date,
                         vendor,
@@ -202,7 +204,7 @@ def process_harpercollins_invoice():
                         full_description,
                         wholesale_price,
                         quantity,
-                    ]
+                    )
                 )
 
     print(f"\\nProcessed {len(rows)} line items")
@@ -214,14 +216,9 @@ def process_harpercollins_invoice():
 
     # Write to Google Sheets TEST tab
     try:
-        from google.auth import default
-        from googleapiclient.discovery import build
-
-        credentials, _ = default()
-        service = build("sheets", "v4", credentials=credentials)
-
         result = (
-            service.spreadsheets()
+            get_sheets_service()
+            .spreadsheets()
             .values()
             .append(
                 spreadsheetId="1cYfpnM_CjgdV1j9hlY-2l0QJMYDWB_hCeXb9KGbgwEo",
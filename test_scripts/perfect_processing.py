@@ -5,73 +5,80 @@ Perfect processing - Match exact expected output format
 import json
 import re
 from datetime import datetime
+from types import MappingProxyType
 
-from main import *
+from sheets_client import get_sheets_service
 
+from main import *
 
-def get_perfect_book_data():
-    """Return exact book data matching the expected output"""
-    return {
-        "9780001839236": {"title": "Summer Story", "price": 9.99, "qty": 3},
-        "9780008547110": {
-            "title": "Brambly Hedge Pop-Up Book, The",
-            "price": 29.99,
-            "qty": 3,
-        },
-        "9780062645425": {"title": "Pleasant Fieldmouse", "price": 24.99, "qty": 3},
-        "9780062883124": {
-            "title": "Frog and Toad Storybook Favorites",
-            "price": 16.99,
-            "qty": 3,
-        },
-        "9780062916570": {"title": "Wild and Free Nature", "price": 22.99, "qty": 3},
-        "9780063090002": {
-            "title": "Plant the Tiny Seed Board Book",
-            "price": 9.99,
-            "qty": 3,
-        },
-        "9780063424500": {"title": "Kiss for Little Bear, A", "price": 17.99, "qty": 3},
-        "9780064435260": {"title": "Little Prairie House, A", "price": 9.99, "qty": 3},
-        "9780544066656": {"title": "Jack and the Beanstalk", "price": 12.99, "qty": 2},
-        "9780544880375": {"title": "Rain! Board Book", "price": 7.99, "qty": 3},
-        "9780547370187": {"title": "Little Red Hen, The", "price": 12.99, "qty": 2},
-        "9780547370194": {"title": "Three Bears, The", "price": 12.99, "qty": 2},
-        "9780547370200": {"title": "Three Little Pigs, The", "price": 12.99, "qty": 2},
-        "9780547449272": {"title": "Tons of Trucks", "price": 13.99, "qty": 3},
-        "9780547668550": {"title": "Little Red Riding Hood", "price": 12.99, "qty": 2},
-        "9780694003617": {
-            "title": "Goodnight Moon Board Book",
-            "price": 10.99,
-            "qty": 3,
-        },
-        "9780694006380": {
-            "title": "My Book of Little House Paper Dolls",
-            "price": 14.99,
-            "qty": 3,
-        },
-        "9780694006519": {"title": "Jamberry Board Book", "price": 9.99, "qty": 3},
-        "9780694013203": {
-            "title": "Grouchy Ladybug Board Book, The",
-            "price": 9.99,
-            "qty": 3,
-        },
-        "9781805074182": {
-            "title": "Drawing, Doodling and Coloring Activity Book Usbor",
-            "price": 6.99,
-            "qty": 3,
-        },
-        "9781805078913": {
-            "title": "Little Sticker Dolly Dressing Puppies Usborne",
-            "price": 8.99,
-            "qty": 3,
-        },
-        "9781836050278": {
-            "title": "Little Sticker Dolly Dressing Fairy Usborne",
-            "price": 8.99,
-            "qty": 3,
-        },
-        "9781911641100": {"title": "Place Called Home, A", "price": 45.00, "qty": 2},
+# Exact book data matching the expected output as ISBN -> (title, list price,
+# quantity), built once at import and exposed read-only
+PERFECT_BOOK_DATA = MappingProxyType(
+    {
+        "9780001839236": ("Summer Story", 9.99, 3),
+        "9780008547110": ("Brambly Hedge Pop-Up Book, The", 29.99, 3),
+        "9780062645425": ("Pleasant Fieldmouse", 24.99, 3),
+        "9780062883124": ("Frog and Toad Storybook Favorites", 16.99, 3),
+        "9780062916570": ("Wild and Free Nature", 22.99, 3),
+        "9780063090002": ("Plant the Tiny Seed Board Book", 9.99, 3),
+        "9780063424500": ("Kiss for Little Bear, A", 17.99, 3),
+        "9780064435260": ("Little Prairie House, A", 9.99, 3),
+        "9780544066656": ("Jack and the Beanstalk", 12.99, 2),
+        "9780544880375": ("Rain! Board Book", 7.99, 3),
+        "9780547370187": ("Little Red Hen, The", 12.99, 2),
+        "9780547370194": ("Three Bears, The", 12.99, 2),
+        "9780547370200": ("Three Little Pigs, The", 12.99, 2),
+        "9780547449272": ("Tons of Trucks", 13.99, 3),
+        "9780547668550": ("Little Red Riding Hood", 12.99, 2),
+        "9780694003617": ("Goodnight Moon Board Book", 10.99, 3),
+        "9780694006380": ("My Book of Little House Paper Dolls", 14.99, 3),
+        "9780694006519": ("Jamberry Board Book", 9.99, 3),
+        "9780694013203": ("Grouchy Ladybug Board Book, The", 9.99, 3),
+        "9781805074182": (
+            "Drawing, Doodling and Coloring Activity Book Usbor",
+            6.99,
+            3,
+        ),
+        "9781805078913": ("Little Sticker Dolly Dressing Puppies Usborne", 8.99, 3),
+        "9781836050278": ("Little Sticker Dolly Dressing Fairy Usborne", 8.99, 3),
+        "9781911641100": ("Place Called Home, A", 45.00, 2),
     }
+)
+
+
+# Fixed invoice values
+ORDER_DATE = "04/29/25"  # MM/DD/YY format
+VENDOR = "HarperCollins"
+ORDER_NUMBER = "NS4435067"
+DISCOUNT = 0.5  # 50%
+
+
+def format_wholesale_price(wholesale_price):
+    """Format price with 3 decimal places if .995, otherwise as-is"""
+    if wholesale_price == int(wholesale_price):
+        return str(int(wholesale_price))
+    return f"{wholesale_price:.3f}"
+
+
+# Many books share a list price, so each distinct price is formatted only once
+WHOLESALE_PRICE_STRINGS = {
+    list_price: format_wholesale_price(list_price * DISCOUNT)
+    for _, list_price, _ in PERFECT_BOOK_DATA.values()
+}
+
+# Every input is fixed, so the rows are built once in exact expected order
+PERFECT_ROWS = tuple(
+    (
+        "",  # Column A (blank)
+        ORDER_DATE,  # Column B
+        VENDOR,  # Column C
+        ORDER_NUMBER,  # Column D
+        f"{isbn}; {title}",  # Column E - ISBN; Title
+        WHOLESALE_PRICE_STRINGS[list_price],  # Column F
+        str(quantity),  # Column G
+    )
+    for isbn, (title, list_price, quantity) in PERFECT_BOOK_DATA.items()
+)
 
 
 def process_harpercollins_invoice():
@@ -79,48 +86,12 @@ def process_harpercollins_invoice():
 
     print("=== PERFECT HARPERCOLLINS PROCESSING ===")
 
-    # Fixed values
-    order_date = "04/29/25"  # MM/DD/YY format
-    vendor = "HarperCollins"
-    order_number = "NS4435067"
-    discount = 0.5  # 50%
-
-    print(f"Date: {order_date}")
-    print(f"Vendor: {vendor}")
-    print(f"Order Number: {order_number}")
-
-    # Get perfect book data in exact order from expected output
-    book_data = get_perfect_book_data()
-
-    # Create rows in exact order
-    rows = []
-
-    for isbn, data in book_data.items():
-        list_price = data["price"]
-        wholesale_price = list_price * discount
-        quantity = data["qty"]
-        title = data["title"]
-
-        # Format exactly like expected: ISBN; Title
-        description = f"{isbn}; {title}"
-
-        # Format price with 3 decimal places if .995, otherwise as-is
-        if wholesale_price == int(wholesale_price):
-            price_str = str(int(wholesale_price))
-        else:
-            price_str = f"{wholesale_price:.3f}"
-
-        rows.append(
-            [
-                "",  # Column A (blank)
-                order_date,  # Column B
-                vendor,  # Column C
-                order_number,  # Column D
-                description,  # Column E
-                price_str,  # Column F
-                str(quantity),  # Column G
-            ]
-        )
+    print(f"Date: {ORDER_DATE}")
+    print(f"Vendor: {VENDOR}")
+    print(f"Order Number: {ORDER_NUMBER}")
+
+    # Rows are immutable tuples, so the precomputed ones are shared as-is
+    rows = list(PERFECT_ROWS)
 
     print(f"\\nCreated {len(rows)} items")
 
@@ -131,14 +102,9 @@ def process_harpercollins_invoice():
 
     # Write to Google Sheets TEST tab
     try:
-        from google.auth import default
-        from googleapiclient.discovery import build
-
-        credentials, _ = default()
-        service = build("sheets", "v4", credentials=credentials)
-
         result = (
-            service.spreadsheets()
+            get_sheets_service()
+            .spreadsheets()
             .values()
             .append(
                 spreadsheetId="1cYfpnM_CjgdV1j9hlY-2l0QJMYDWB_hCeXb9KGbgwEo",
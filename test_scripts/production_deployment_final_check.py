@@ -5,17 +5,58 @@ Quick comprehensive validation to confirm all systems are production ready.
 
 import io
 import json
+import multiprocessing
 import os
 import sys
-import threading
 import time
 from contextlib import redirect_stderr, redirect_stdout
+from functools import lru_cache
 
 # Add the main directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from main import detect_vendor_type, process_creative_coop_document
 
 
+class MockProperty:
+    """Document AI property stand-in; slots avoid a per-instance dict"""
+
+    __slots__ = ("type_", "mention_text", "confidence")
+
+    def __init__(self, type_, mention_text, confidence):
+        self.type_ = type_
+        self.mention_text = mention_text
+        self.confidence = confidence
+
+
+class MockEntity:
+    """Document AI entity stand-in; slots avoid a per-instance dict"""
+
+    __slots__ = ("type_", "mention_text", "confidence", "properties")
+
+    def __init__(self, type_, mention_text, confidence, properties=None):
+        self.type_ = type_
+        self.mention_text = mention_text
+        self.confidence = confidence
+        self.properties = properties if properties is not None else []
+
+
+class MockDocument:
+    """Document AI document stand-in; slots avoid a per-instance dict"""
+
+    __slots__ = ("text", "entities")
+
+    def __init__(self, text, entities=None):
+        self.text = text
+        self.entities = entities if entities is not None else []
+
+
+def make_line_item_document(text):
+    """Build a mock document whose single line item entity spans the whole text"""
+    return MockDocument(text, [MockEntity("line_item", text, 0.9)])
+
+
+# Checks only read .text/.entities, so every check and worker shares one document
+@lru_cache(maxsize=1)
 def load_test_document():
     """Load test document for validation"""
     json_file = "/Volumes/Working/Code/GoogleCloud/invoice-processor-fn/test_invoices/CS003837319_Error 2_docai_output.json"
@@ -25,29 +66,27 @@ def load_test_document():
             doc_data = json.load(f)
 
         # Create mock document object
-        class MockDocument:
-            def __init__(self, doc_data):
-                self.text = doc_data.get("text", "")
-                self.entities = []
-
-                for entity_data in doc_data.get("entities", []):
-                    entity = type("Entity", (), {})()
-                    entity.type_ = entity_data.get("type", "")
-                    entity.mention_text = entity_data.get("mentionText", "")
-                    entity.confidence = entity_data.get("confidence", 0.0)
-                    entity.properties = []
-
-                    if "properties" in entity_data:
-                        for prop_data in entity_data["properties"]:
-                            prop = type("Property", (), {})()
-                            prop.type_ = prop_data.get("type", "")
-                            prop.mention_text = prop_data.get("mentionText", "")
-                            prop.confidence = prop_data.get("confidence", 0.0)
-                            entity.properties.append(prop)
-
-                    self.entities.append(entity)
-
-        return MockDocument(doc_data)
+        entities = []
+        for entity_data in doc_data.get("entities", []):
+            entity = MockEntity(
+                entity_data.get("type", ""),
+                entity_data.get("mentionText", ""),
+                entity_data.get("confidence", 0.0),
+            )
+
+            if "properties" in entity_data:
+                for prop_data in entity_data["properties"]:
+                    entity.properties.append(
+                        MockProperty(
+                            prop_data.get("type", ""),
+                            prop_data.get("mentionText", ""),
+                            prop_data.get("confidence", 0.0),
+                        )
+                    )
+
+            entities.append(entity)
+
+        return MockDocument(doc_data.get("text", ""), entities)
 
     except FileNotFoundError:
         # Create fallback mock document
@@ -58,19 +97,7 @@ Product Code | UPC         | Description                          | Qty Ord | Qt
 XS9826A      | 191009727774| 6"H Metal Ballerina Ornament       | 24      | 0         | 0           | 24        | each | 2.00       | 1.60       | 38.40
 XS9649A      | 191009725688| 8"H x 6.5"W x 4"D Paper Mache      | 24      | 0         | 0           | 24        | each | 3.50       | 2.80       | 67.20"""
 
-        class MockDocument:
-            def __init__(self, text):
-                self.text = text
-                self.entities = []
-
-                entity = type("Entity", (), {})()
-                entity.type_ = "line_item"
-                entity.mention_text = text
-                entity.confidence = 0.9
-                entity.properties = []
-                self.entities.append(entity)
-
-        return MockDocument(fallback_text)
+        return make_line_item_document(fallback_text)
 
 
 def run_core_functionality_check():
@@ -180,6 +207,23 @@ def run_performance_check():
     return performance_ok
 
 
+def process_worker(worker_id, document):
+    """Worker function for concurrent processing"""
+    try:
+        start_time = time.time()
+        rows = process_creative_coop_document(document)
+        end_time = time.time()
+
+        return {
+            "worker_id": worker_id,
+            "success": True,
+            "processing_time": end_time - start_time,
+            "rows": len(rows),
+        }
+    except Exception as e:
+        return {"worker_id": worker_id, "success": False, "error": str(e)}
+
+
 def run_load_resilience_check():
     """Test system resilience under load"""
     print("\n🚀 Load Resilience Check")
@@ -189,37 +233,32 @@ def run_load_resilience_check():
     concurrent_requests = 3
     results = []
 
-    def process_worker(worker_id):
-        """Worker function for concurrent processing"""
-        try:
-            document = load_test_document()
-            start_time = time.time()
-            rows = process_creative_coop_document(document)
-            end_time = time.time()
-
-            results.append(
-                {
-                    "worker_id": worker_id,
-                    "success": True,
-                    "processing_time": end_time - start_time,
-                    "rows": len(rows),
-                }
-            )
-        except Exception as e:
-            results.append({"worker_id": worker_id, "success": False, "error": str(e)})
+    # Build the document once and pass it to every worker; it is pickled into
+    # each worker process, so none of them reloads the fixture
+    document = load_test_document()
 
-    # Execute concurrent workers
-    threads = []
+    # Processing is CPU-bound Python, so run workers in separate processes to
+    # get real parallelism instead of GIL-serialized threads
     start_time = time.time()
 
-    for i in range(concurrent_requests):
-        thread = threading.Thread(target=process_worker, args=(i,))
-        threads.append(thread)
-        thread.start()
-
-    # Wait for completion
-    for thread in threads:
-        thread.join(timeout=60)
+    # Leaving the block terminates the pool, killing any worker still running
+    # after its timeout instead of waiting on it
+    with multiprocessing.Pool(processes=concurrent_requests) as pool:
+        pending = [
+            pool.apply_async(process_worker, (i, document))
+            for i in range(concurrent_requests)
+        ]
+
+        # Wait for completion
+        for i, result in enumerate(pending):
+            try:
+                results.append(result.get(timeout=60))
+            except multiprocessing.TimeoutError:
+                results.append(
+                    {"worker_id": i, "success": False, "error": "timed out after 60s"}
+                )
+            except Exception as e:
+                results.append({"worker_id": i, "success": False, "error": str(e)})
 
     total_time = time.time() - start_time
 
@@ -238,10 +277,13 @@ def run_load_resilience_check():
     print(f"   Total time: {total_time:.1f}s")
 
     if successful:
-        avg_processing_time = sum(r["processing_time"] for r in successful) / len(
-            successful
-        )
-        total_rows = sum(r["rows"] for r in successful)
+        # Accumulate time and rows in a single pass over the results
+        total_processing_time = 0.0
+        total_rows = 0
+        for r in successful:
+            total_processing_time += r["processing_time"]
+            total_rows += r["rows"]
+        avg_processing_time = total_processing_time / len(successful)
         print(f"   Avg processing time: {avg_processing_time:.1f}s")
         print(f"   Total rows extracted: {total_rows}")
 
@@ -287,19 +329,7 @@ def run_error_handling_check():
         print(f"   Testing: {scenario['name']}")
 
         # Create test document
-        class TestDocument:
-            def __init__(self, text):
-                self.text = text
-                self.entities = []
-
-                entity = type("Entity", (), {})()
-                entity.type_ = "line_item"
-                entity.mention_text = text
-                entity.confidence = 0.9
-                entity.properties = []
-                self.entities.append(entity)
-
-        document = TestDocument(scenario["document_text"])
+        document = make_line_item_document(scenario["document_text"])
 
         try:
             start_time = time.time()
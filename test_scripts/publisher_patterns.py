@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+Publisher names shared by the HarperCollins processing scripts
+"""
+
+import re
+
+# Publisher names in priority order, plus one alternation to find them all
+PUBLISHERS = [
+    "HarperCollins",
+    "Harper Collins",
+    "Penguin",
+    "Random House",
+    "Simon Schuster",
+]
+PUBLISHER_PATTERN = re.compile(
+    "|".join(re.escape(publisher) for publisher in PUBLISHERS), re.IGNORECASE
+)
@@ -2,17 +2,187 @@
 """
 Complete Phase 01 Creative-Coop integration validation
 Runs all tests and generates comprehensive validation report
+
+Usage: run_creative_coop_phase01_validation.py [--full] [--no-cache]
 """
 
+import contextlib
+import hashlib
+import io
 import json
-import subprocess
+import multiprocessing
+import os
+import re
+import runpy
 import sys
 import time
+import traceback
+from collections import deque
+from functools import lru_cache
 from pathlib import Path
 
+# The validator runs from the repository root, where main.py lives
+if "." not in sys.path:
+    sys.path.insert(0, ".")
+
+from main import process_creative_coop_document
+
+# Creative-Coop product codes such as DA4315 or DF6419A
+PRODUCT_CODE_PATTERN = re.compile(r"([A-Z]{2}\d+[A-Z]?)")
+
+# Last passing result per (script, script mtime, dependency mtimes)
+VALIDATION_CACHE_PATH = Path(".cache/phase01_validation.json")
+
+# Files every Phase 01 script's result depends on besides the script itself:
+# the processing code, the shared Document AI fixture and this runner
+VALIDATION_CACHE_DEPENDENCIES = (
+    "main.py",
+    "test_invoices/CS003837319_Error_docai_output.json",
+    __file__,
+)
+
+# Scripts that assert on their own wall time or timing variance; they run
+# alone instead of alongside the other scripts
+TIMING_SENSITIVE_SCRIPTS = frozenset({"test_creative_coop_phase01_integration.py"})
+
+# The report only shows the last few success lines of each script's output
+STDOUT_TAIL_LINES = 256
+
+
+class TailBuffer:
+    """Text stream that keeps only the last maxlen lines written to it"""
+
+    def __init__(self, maxlen=STDOUT_TAIL_LINES):
+        self.lines = deque(maxlen=maxlen)
+        self.partial = ""
+
+    def write(self, text):
+        *complete, self.partial = (self.partial + text).split("\n")
+        self.lines.extend(complete)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        return "\n".join([*self.lines, self.partial])
+
+
+class MockEntity:
+    """Document AI entity stand-in; slots avoid a per-instance dict"""
+
+    __slots__ = ("type_", "mention_text")
+
+    def __init__(self, type_, mention_text):
+        self.type_ = type_
+        self.mention_text = mention_text
+
+
+class MockDocument:
+    """Document AI document stand-in; slots avoid a per-instance dict"""
+
+    __slots__ = ("text", "entities")
+
+    def __init__(self, text, entities):
+        self.text = text
+        self.entities = entities
+
 
-def run_phase01_integration_tests():
-    """Run complete Phase 01 integration test suite"""
+@lru_cache(maxsize=1)
+def _load_mock_document():
+    """Load the CS003837319 Document AI output once as a lightweight document"""
+    with open("test_invoices/CS003837319_Error_docai_output.json", "r") as f:
+        doc_data = json.load(f)
+
+    # Entities are a tuple since the cached document is shared
+    entities = tuple(
+        MockEntity(entity_data.get("type"), entity_data.get("mentionText", ""))
+        for entity_data in doc_data.get("entities", [])
+    )
+    return MockDocument(doc_data.get("text", ""), entities)
+
+
+@lru_cache(maxsize=1)
+def _process_mock_document():
+    """Process the cached mock document once, returning its rows and run time"""
+    mock_document = _load_mock_document()
+    start_time = time.time()
+    results = process_creative_coop_document(mock_document)
+    return results, time.time() - start_time
+
+
+def validation_cache_key(test_script):
+    """Key a test script's result by its own and its dependencies' modification times"""
+    script_path = f"test_scripts/{test_script}"
+    try:
+        mtimes = [
+            os.stat(path).st_mtime_ns
+            for path in (script_path, *VALIDATION_CACHE_DEPENDENCIES)
+        ]
+    except FileNotFoundError:
+        return None
+    return hashlib.sha1(f"{script_path}{mtimes}".encode()).hexdigest()
+
+
+def load_validation_cache():
+    """Load cached passing results, or an empty cache if none is readable"""
+    try:
+        with open(VALIDATION_CACHE_PATH, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_validation_cache(cache):
+    """Persist cached passing results for the next run"""
+    VALIDATION_CACHE_PATH.parent.mkdir(exist_ok=True)
+    with open(VALIDATION_CACHE_PATH, "w") as f:
+        json.dump(cache, f)
+
+
+def write_lines(lines):
+    """Write report lines to stdout in a single call"""
+    if lines:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def run_test_script(task_name, test_script):
+    """Run one Phase 01 test script in-process and capture its outcome"""
+    # Executing the script in this (pool worker) process avoids starting a
+    # fresh interpreter per script. Only under the fork start method does the
+    # worker also inherit the parent's imported main module; under spawn (the
+    # macOS and Windows default) it imports main again
+    # stdout is bounded to its tail; stderr is kept whole for the error report
+    stdout, stderr = TailBuffer(), io.StringIO()
+    returncode = 0
+
+    start = time.time()
+    with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+        try:
+            runpy.run_path(f"test_scripts/{test_script}", run_name="__main__")
+        except SystemExit as e:
+            returncode = e.code if isinstance(e.code, int) else int(e.code is not None)
+        except Exception:
+            traceback.print_exc()
+            returncode = 1
+
+    return {
+        "task": task_name,
+        "script": test_script,
+        "duration": time.time() - start,
+        "returncode": returncode,
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+    }
+
+
+def run_phase01_integration_tests(use_cache=True):
+    """Run complete Phase 01 integration test suite
+
+    Scripts whose last run passed are skipped while neither they nor
+    main.py, the Phase 01 fixture or this runner have changed, unless
+    use_cache is False.
+    """
 
     print("🚀 Starting Creative-Coop Phase 01 Integration Validation")
     print("=" * 60)
@@ -32,66 +202,97 @@ def run_phase01_integration_tests():
         ("Phase 01 Integration", "test_creative_coop_phase01_integration.py"),
     ]
 
-    for task_name, test_script in test_sequence:
-        print(f"\n📋 Running {task_name}: {test_script}")
-        print("-" * 40)
+    cache = load_validation_cache()
+    cache_keys = [validation_cache_key(script) for _, script in test_sequence]
+    # Missing scripts are skipped up front instead of being sent to a worker
+    scripts_found = [
+        (Path("test_scripts") / script).is_file() for _, script in test_sequence
+    ]
+    # Scripts that actually run rather than reuse a cached passing result
+    scripts_to_run = [
+        found and not (use_cache and key in cache)
+        for key, found in zip(cache_keys, scripts_found)
+    ]
 
-        try:
-            start = time.time()
-            result = subprocess.run(
-                [sys.executable, f"test_scripts/{test_script}"],
-                capture_output=True,
-                text=True,
-                timeout=300,
-                cwd=".",
+    # Each script runs in its own worker process, so launch the others at once
+    # and report in sequence order as results come back. Timing-sensitive
+    # scripts come last in the sequence and are only launched once every
+    # earlier script has reported, so they run alone. maxtasksperchild=1 gives
+    # every script a fresh worker, so none sees module state or caches left
+    # behind by another. Leaving the block terminates the pool, killing any
+    # script still running after its timeout.
+    with multiprocessing.Pool(processes=len(test_sequence), maxtasksperchild=1) as pool:
+        pending = [
+            (
+                pool.apply_async(run_test_script, (task_name, test_script))
+                if run and test_script not in TIMING_SENSITIVE_SCRIPTS
+                else None
             )
+            for (task_name, test_script), run in zip(test_sequence, scripts_to_run)
+        ]
 
-            duration = time.time() - start
-
-            test_results["tests_run"].append(
-                {
-                    "task": task_name,
-                    "script": test_script,
-                    "duration": duration,
-                    "returncode": result.returncode,
-                    "stdout": result.stdout,
-                    "stderr": result.stderr,
-                }
-            )
+        for (task_name, test_script), key, found, run, result in zip(
+            test_sequence, cache_keys, scripts_found, scripts_to_run, pending
+        ):
+            print(f"\n📋 Running {task_name}: {test_script}")
+            print("-" * 40)
+
+            if not found:
+                print(f"⚠️ {task_name} SKIPPED (test script not found)")
+                continue
+
+            if run and result is None:
+                result = pool.apply_async(run_test_script, (task_name, test_script))
+
+            try:
+                test_run = result.get(timeout=300) if run else cache[key]
+
+            except multiprocessing.TimeoutError:
+                test_results["failed"] += 1
+                test_results["errors"].append(
+                    {"task": task_name, "error": "Test timed out after 300 seconds"}
+                )
+                print(f"⏱️ {task_name} TIMEOUT")
+                continue
+
+            test_results["tests_run"].append(test_run)
+            duration = test_run["duration"]
 
-            if result.returncode == 0:
+            # Only passing runs are cached; a failure invalidates the entry
+            if key is not None:
+                if test_run["returncode"] == 0:
+                    cache[key] = test_run
+                else:
+                    cache.pop(key, None)
+
+            if test_run["returncode"] == 0:
                 test_results["passed"] += 1
-                print(f"✅ {task_name} PASSED ({duration:.2f}s)")
+                cached = "" if run else " cached"
+                print(f"✅ {task_name} PASSED ({duration:.2f}s{cached})")
                 # Show key success indicators
-                if "✅" in result.stdout:
+                if "✅" in test_run["stdout"]:
                     success_lines = [
-                        line for line in result.stdout.split("\n") if "✅" in line
+                        line for line in test_run["stdout"].split("\n") if "✅" in line
                     ]
                     for line in success_lines[-3:]:  # Show last 3 success indicators
                         print(f"   {line.strip()}")
             else:
                 test_results["failed"] += 1
                 print(f"❌ {task_name} FAILED ({duration:.2f}s)")
-                if result.stderr:
-                    print(f"   Error: {result.stderr.strip()[:200]}")
+                if test_run["stderr"]:
+                    print(f"   Error: {test_run['stderr'].strip()[:200]}")
                 test_results["errors"].append(
                     {
                         "task": task_name,
                         "error": (
-                            result.stderr.strip() if result.stderr else "Unknown error"
+                            test_run["stderr"].strip()
+                            if test_run["stderr"]
+                            else "Unknown error"
                         ),
                     }
                 )
 
-        except subprocess.TimeoutExpired:
-            test_results["failed"] += 1
-            test_results["errors"].append(
-                {"task": task_name, "error": "Test timed out after 300 seconds"}
-            )
-            print(f"⏱️ {task_name} TIMEOUT")
-
-        except FileNotFoundError:
-            print(f"⚠️ {task_name} SKIPPED (test script not found)")
+    save_validation_cache(cache)
 
     # Generate comprehensive report
     total_time = time.time() - test_results["start_time"]
@@ -102,52 +303,58 @@ def run_phase01_integration_tests():
 
 def generate_integration_report(test_results, total_time):
     """Generate comprehensive Phase 01 integration validation report"""
-
-    print("\n" + "=" * 60)
-    print("📊 CREATIVE-COOP PHASE 01 INTEGRATION REPORT")
-    print("=" * 60)
+    # Report lines are collected and written in batches rather than per line
+    lines = []
+    lines.append("\n" + "=" * 60)
+    lines.append("📊 CREATIVE-COOP PHASE 01 INTEGRATION REPORT")
+    lines.append("=" * 60)
 
     # Summary metrics
     total_tests = test_results["passed"] + test_results["failed"]
     success_rate = test_results["passed"] / total_tests if total_tests > 0 else 0
 
-    print(f"📈 SUMMARY")
-    print(f"   Total Tests Run: {total_tests}")
-    print(f"   Passed: {test_results['passed']} ✅")
-    print(f"   Failed: {test_results['failed']} ❌")
-    print(f"   Success Rate: {success_rate:.1%}")
-    print(f"   Total Duration: {total_time:.2f}s")
+    lines.append(f"📈 SUMMARY")
+    lines.append(f"   Total Tests Run: {total_tests}")
+    lines.append(f"   Passed: {test_results['passed']} ✅")
+    lines.append(f"   Failed: {test_results['failed']} ❌")
+    lines.append(f"   Success Rate: {success_rate:.1%}")
+    lines.append(f"   Total Duration: {total_time:.2f}s")
 
     # Detailed results
-    print(f"\n📋 DETAILED RESULTS")
+    lines.append(f"\n📋 DETAILED RESULTS")
     for test in test_results["tests_run"]:
         status = "✅ PASS" if test["returncode"] == 0 else "❌ FAIL"
-        print(f"   {test['task']:<25} {status:<8} ({test['duration']:.2f}s)")
+        lines.append(f"   {test['task']:<25} {status:<8} ({test['duration']:.2f}s)")
 
     # Error details
     if test_results["errors"]:
-        print(f"\n🚨 ERROR DETAILS")
+        lines.append(f"\n🚨 ERROR DETAILS")
         for error in test_results["errors"]:
-            print(f"   {error['task']}: {error['error'][:100]}...")
+            lines.append(f"   {error['task']}: {error['error'][:100]}...")
 
     # Phase 01 Business Requirements Validation
-    print(f"\n🎯 PHASE 01 BUSINESS REQUIREMENTS")
+    lines.append(f"\n🎯 PHASE 01 BUSINESS REQUIREMENTS")
+    # Flush before validating, since processing prints its own progress
+    write_lines(lines)
+    lines = []
     requirements_status = validate_business_requirements()
     for req, status in requirements_status.items():
         indicator = "✅" if status["passed"] else "❌"
-        print(f"   {req:<40} {indicator} {status['details']}")
+        lines.append(f"   {req:<40} {indicator} {status['details']}")
 
     # Final assessment
-    print(f"\n🏆 PHASE 01 INTEGRATION STATUS")
+    lines.append(f"\n🏆 PHASE 01 INTEGRATION STATUS")
     if success_rate >= 0.85 and test_results["failed"] == 0:
-        print("   ✅ READY FOR PRODUCTION DEPLOYMENT")
-        print("   All integration tests passed, business requirements met")
+        lines.append("   ✅ READY FOR PRODUCTION DEPLOYMENT")
+        lines.append("   All integration tests passed, business requirements met")
     elif success_rate >= 0.70:
-        print("   ⚠️ NEEDS MINOR FIXES")
-        print("   Most tests passing, address remaining issues")
+        lines.append("   ⚠️ NEEDS MINOR FIXES")
+        lines.append("   Most tests passing, address remaining issues")
     else:
-        print("   ❌ REQUIRES SIGNIFICANT WORK")
-        print("   Multiple critical issues need resolution")
+        lines.append("   ❌ REQUIRES SIGNIFICANT WORK")
+        lines.append("   Multiple critical issues need resolution")
+
+    write_lines(lines)
 
 
 def validate_business_requirements():
@@ -156,45 +363,38 @@ def validate_business_requirements():
 
     try:
         # Load test results from CS003837319 processing
-        sys.path.insert(0, ".")
-        from unittest.mock import Mock
+        results, processing_time = _process_mock_document()
 
-        from main import process_creative_coop_document
-
-        with open("test_invoices/CS003837319_Error_docai_output.json", "r") as f:
-            doc_data = json.load(f)
-
-        mock_document = Mock()
-        mock_document.text = doc_data.get("text", "")
-        mock_document.entities = []
-
-        for entity_data in doc_data.get("entities", []):
-            entity = Mock()
-            entity.type_ = entity_data.get("type")
-            entity.mention_text = entity_data.get("mentionText", "")
-            mock_document.entities.append(entity)
-
-        results = process_creative_coop_document(mock_document)
+        # Tally every requirement's counters in a single pass over the rows
+        invoice_success = 0
+        product_codes = set()
+        complete_records = 0
+        placeholder_count = 0
+        for row in results:
+            n = len(row)
+            if n > 2 and "CS003837319" in str(row[2]):
+                invoice_success += 1
+            if n <= 3:
+                continue
+
+            description = str(row[3])
+            match = PRODUCT_CODE_PATTERN.search(description)
+            if match:
+                product_codes.add(match.group(1))
+            if n >= 6 and row[2] and row[3] and row[4] and row[5]:
+                complete_records += 1
+            if "Traditional D-code format" in description or (
+                n > 5 and "$1.60" in str(row[4]) and str(row[5]) == "24"
+            ):
+                placeholder_count += 1
 
         # Requirement 1: Invoice number extraction 0% → 100%
-        invoice_success = sum(
-            1 for row in results if len(row) > 2 and "CS003837319" in str(row[2])
-        )
         requirements["Invoice Number Extraction"] = {
             "passed": invoice_success > 0,
             "details": f"{invoice_success} rows with CS003837319",
         }
 
         # Requirement 2: Complete product processing 43 → 130+
-        product_codes = set()
-        for row in results:
-            if len(row) > 3:
-                import re
-
-                match = re.search(r"([A-Z]{2}\d+[A-Z]?)", str(row[3]))
-                if match:
-                    product_codes.add(match.group(1))
-
         unique_products = len(product_codes)
         requirements["Product Processing Scope"] = {
             "passed": unique_products
@@ -204,11 +404,6 @@ def validate_business_requirements():
 
         # Requirement 3: Processing quality >85%
         total_products = len(results)
-        complete_records = sum(
-            1
-            for row in results
-            if len(row) >= 6 and all([row[2], row[3], row[4], row[5]])
-        )
         quality_rate = complete_records / total_products if total_products > 0 else 0
 
         requirements["Processing Quality"] = {
@@ -217,31 +412,12 @@ def validate_business_requirements():
         }
 
         # Requirement 4: Zero placeholder entries
-        placeholder_count = sum(
-            1
-            for row in results
-            if len(row) > 3
-            and (
-                "Traditional D-code format" in str(row[3])
-                or (
-                    len(row) > 4
-                    and "$1.60" in str(row[4])
-                    and len(row) > 5
-                    and str(row[5]) == "24"
-                )
-            )
-        )
         requirements["Placeholder Elimination"] = {
             "passed": placeholder_count == 0,
             "details": f"{placeholder_count} placeholder entries found",
         }
 
         # Requirement 5: Performance within limits
-        start_time = time.time()
-        # Run a quick performance test
-        test_results = process_creative_coop_document(mock_document)
-        processing_time = time.time() - start_time
-
         requirements["Performance"] = {
             "passed": processing_time < 120,  # Should complete within 120 seconds
             "details": f"{processing_time:.2f}s processing time",
@@ -261,63 +437,46 @@ def run_focused_integration_validation():
     print("\n🔍 FOCUSED PHASE 01 VALIDATION")
     print("=" * 60)
 
+    lines = []
     try:
-        # Import processing function
-        sys.path.insert(0, ".")
-        from unittest.mock import Mock
-
-        from main import process_creative_coop_document
-
-        # Load test data
-        with open("test_invoices/CS003837319_Error_docai_output.json", "r") as f:
-            doc_data = json.load(f)
-
-        mock_document = Mock()
-        mock_document.text = doc_data.get("text", "")
-        mock_document.entities = []
-
-        for entity_data in doc_data.get("entities", []):
-            entity = Mock()
-            entity.type_ = entity_data.get("type")
-            entity.mention_text = entity_data.get("mentionText", "")
-            mock_document.entities.append(entity)
-
         # Run processing with timing
-        start_time = time.time()
-        results = process_creative_coop_document(mock_document)
-        processing_time = time.time() - start_time
+        results, processing_time = _process_mock_document()
 
-        print(f"\n📊 PROCESSING RESULTS")
-        print(f"   Total Products: {len(results)}")
-        print(f"   Processing Time: {processing_time:.2f}s")
+        lines.append(f"\n📊 PROCESSING RESULTS")
+        lines.append(f"   Total Products: {len(results)}")
+        lines.append(f"   Processing Time: {processing_time:.2f}s")
 
         # Analyze results quality
         if results:
-            # Extract product codes
+            # Collect product codes, unique values and invoice hits in one pass
             product_codes = set()
+            prices = set()
+            quantities = set()
+            invoice_success = 0
             for row in results:
-                if len(row) > 3:
-                    import re
-
-                    match = re.search(r"([A-Z]{2}\d+[A-Z]?)", str(row[3]))
+                n = len(row)
+                if n > 2 and "CS003837319" in str(row[2]):
+                    invoice_success += 1
+                if n > 3:
+                    match = PRODUCT_CODE_PATTERN.search(str(row[3]))
                     if match:
                         product_codes.add(match.group(1))
-
-            # Count unique values
-            unique_prices = len(set(row[4] for row in results if len(row) > 4))
-            unique_quantities = len(set(row[5] for row in results if len(row) > 5))
-
-            # Check invoice extraction
-            invoice_success = sum(
-                1 for row in results if len(row) > 2 and "CS003837319" in str(row[2])
+                if n > 4:
+                    prices.add(row[4])
+                if n > 5:
+                    quantities.add(row[5])
+
+            unique_prices = len(prices)
+            unique_quantities = len(quantities)
+
+            lines.append(f"\n🎯 QUALITY METRICS")
+            lines.append(f"   Unique Product Codes: {len(product_codes)}")
+            lines.append(f"   Unique Prices: {unique_prices}")
+            lines.append(f"   Unique Quantities: {unique_quantities}")
+            lines.append(
+                f"   Invoice Extraction: {invoice_success}/{len(results)} rows"
             )
 
-            print(f"\n🎯 QUALITY METRICS")
-            print(f"   Unique Product Codes: {len(product_codes)}")
-            print(f"   Unique Prices: {unique_prices}")
-            print(f"   Unique Quantities: {unique_quantities}")
-            print(f"   Invoice Extraction: {invoice_success}/{len(results)} rows")
-
             # Calculate overall score
             scores = []
             scores.append(min(1.0, len(product_codes) / 100))  # Product count score
@@ -330,25 +489,29 @@ def run_focused_integration_validation():
 
             overall_score = sum(scores) / len(scores)
 
-            print(f"\n🏆 OVERALL INTEGRATION SCORE: {overall_score:.1%}")
+            lines.append(f"\n🏆 OVERALL INTEGRATION SCORE: {overall_score:.1%}")
 
             if overall_score >= 0.85:
-                print("   ✅ EXCELLENT: Phase 01 integration exceeds targets")
+                lines.append("   ✅ EXCELLENT: Phase 01 integration exceeds targets")
                 return True
             elif overall_score >= 0.70:
-                print("   ⚠️ GOOD: Phase 01 integration meets most requirements")
+                lines.append("   ⚠️ GOOD: Phase 01 integration meets most requirements")
                 return True
             else:
-                print("   ❌ NEEDS IMPROVEMENT: Integration below target")
+                lines.append("   ❌ NEEDS IMPROVEMENT: Integration below target")
                 return False
         else:
-            print("   ❌ NO RESULTS: Processing failed")
+            lines.append("   ❌ NO RESULTS: Processing failed")
             return False
 
     except Exception as e:
-        print(f"   ❌ ERROR: {str(e)}")
+        lines.append(f"   ❌ ERROR: {str(e)}")
         return False
 
+    finally:
+        # Everything after the processing run is written in one batch
+        write_lines(lines)
+
 
 if __name__ == "__main__":
     print("Creative-Coop Phase 01 Integration Validation")
@@ -357,9 +520,11 @@ if __name__ == "__main__":
     # Run focused validation first (faster)
     focused_success = run_focused_integration_validation()
 
-    if len(sys.argv) > 1 and sys.argv[1] == "--full":
+    if "--full" in sys.argv[1:]:
         # Run full test suite if requested
-        results = run_phase01_integration_tests()
+        results = run_phase01_integration_tests(
+            use_cache="--no-cache" not in sys.argv[1:]
+        )
 
         # Exit with appropriate code
         if results["failed"] == 0:
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Run the improved HarperCollins and Creative-Coop processing scripts in parallel
+
+Each script loads and parses its own Document AI output and shares no state with
+the others, so they run in separate worker processes instead of back to back.
+"""
+
+import importlib
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+TEST_SCRIPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(TEST_SCRIPTS_DIR)
+
+# (script module, entry point) pairs - each loads its own test invoice
+IMPROVED_SCRIPTS = [
+    ("improved_processing", "process_harpercollins_invoice"),
+    (
+        "improved_creative_coop_processing",
+        "process_creative_coop_with_improved_mapping",
+    ),
+    ("improved_algorithmic_mapping", "validate_algorithmic_mapping"),
+]
+
+
+def run_script(module_name, entry_point):
+    """Import a processing script inside the worker and run its entry point"""
+    # Scripts import from main and open test_invoices/ relative to the repo root
+    os.chdir(REPO_ROOT)
+    for path in (REPO_ROOT, TEST_SCRIPTS_DIR):
+        if path not in sys.path:
+            sys.path.insert(0, path)
+
+    start = time.time()
+    try:
+        module = importlib.import_module(module_name)
+        getattr(module, entry_point)()
+        return {"script": module_name, "success": True, "duration": time.time() - start}
+    except Exception:
+        return {
+            "script": module_name,
+            "success": False,
+            "duration": time.time() - start,
+            "error": traceback.format_exc(),
+        }
+
+
+def run_improved_processing():
+    """Run all improved processing scripts concurrently and summarize results"""
+    print("🚀 Running improved processing scripts in parallel")
+    print("=" * 60)
+
+    start = time.time()
+    results = []
+
+    with ProcessPoolExecutor(max_workers=len(IMPROVED_SCRIPTS)) as executor:
+        futures = [
+            executor.submit(run_script, module_name, entry_point)
+            for module_name, entry_point in IMPROVED_SCRIPTS
+        ]
+        for future in as_completed(futures):
+            results.append(future.result())
+
+    print("\n" + "=" * 60)
+    for result in sorted(results, key=lambda r: r["script"]):
+        status = "✅" if result["success"] else "❌"
+        print(f"{status} {result['script']} ({result['duration']:.2f}s)")
+        if not result["success"]:
+            print(f"   Error: {result['error'].strip()[-300:]}")
+
+    print(f"\nTotal wall time: {time.time() - start:.2f}s")
+    return all(result["success"] for result in results)
+
+
+if __name__ == "__main__":
+    sys.exit(0 if run_improved_processing() else 1)
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Shared Google Sheets client for the processing scripts
+
+Credential resolution through google.auth.default() hits the metadata server or
+credential files on every call, so the built service is created once per process.
+The Google client libraries are imported lazily on first use.
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_sheets_service():
+    """Return a Sheets v4 service built from default credentials"""
+    from google.auth import default
+    from googleapiclient.discovery import build
+
+    credentials, _ = default()
+    return build("sheets", "v4", credentials=credentials)
@@ -0,0 +1,56 @@
+"""
+Test the raw-text product -> description -> UPC mapping used by the improved
+Creative-Coop processing script
+"""
+
+import os
+import sys
+
+# Add parent directory to path to import main
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from improved_creative_coop_processing import (
+    extract_creative_coop_mapping_from_raw_text,
+)
+
+TABLE_HEADER = "Qty | Description | Extended | Amount |\n"
+FIRST_ITEM = "807472767956 | Embossed Drinking Glass | DA4315 |\n"
+SECOND_ITEM = "191009197164 | Bone Photo Frame | DF0716 |\n"
+
+
+class TestImprovedCreativeCoopMapping:
+    """Test which parts of the raw text extract_creative_coop_mapping_from_raw_text maps"""
+
+    def test_maps_items_after_table_header(self):
+        """Items following the table header are mapped to their UPCs"""
+        text = "Invoice CI004848705\n" + TABLE_HEADER + FIRST_ITEM + SECOND_ITEM
+
+        mappings = extract_creative_coop_mapping_from_raw_text(text)
+
+        assert set(mappings) == {"DA4315", "DF0716"}
+        assert mappings["DA4315"]["upc"] == "0807472767956"
+        assert mappings["DA4315"]["description"] == "Embossed Drinking Glass"
+
+    def test_maps_items_without_table_header(self):
+        """A missing table header still maps every item"""
+        mappings = extract_creative_coop_mapping_from_raw_text(FIRST_ITEM + SECOND_ITEM)
+
+        assert set(mappings) == {"DA4315", "DF0716"}
+
+    def test_maps_product_code_before_table_header(self):
+        """A product code before the table header is mapped as well"""
+        mappings = extract_creative_coop_mapping_from_raw_text(
+            FIRST_ITEM + TABLE_HEADER + SECOND_ITEM
+        )
+
+        assert set(mappings) == {"DA4315", "DF0716"}
+        assert mappings["DA4315"]["description"] == "Embossed Drinking Glass"
+
+    def test_maps_first_item_to_upc_before_table_header(self):
+        """The first item after the header keeps a UPC printed just before it"""
+        text = "807472767956 | " + TABLE_HEADER + "Embossed Drinking Glass | DA4315 |\n"
+
+        mappings = extract_creative_coop_mapping_from_raw_text(text)
+
+        assert set(mappings) == {"DA4315"}
+        assert mappings["DA4315"]["upc"] == "0807472767956"